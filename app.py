@@ -8,16 +8,14 @@ from dotenv import load_dotenv
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 from llm_client import LLMClient
-from config import STATUS_TYPES
+from status_catalog import compile_catalog
+from log_config import configure_logging, new_request_id, request_id_var
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Initialize Slack app
@@ -29,36 +27,46 @@ app = App(
 # Initialize LLM client
 llm_client = LLMClient()
 
+# Validate config and precompute static responses
+catalog = compile_catalog()
+
 @app.command("/witty_status")
 def handle_status_command(ack, command):
     """Handle the /witty_status slash command"""
     ack()
-    
+    # Bolt runs handlers on pooled threads, so clear the ID before the thread moves on
+    request_token = new_request_id()
+    try:
+        _generate_and_send_status(command)
+    finally:
+        request_id_var.reset(request_token)
+
+def _generate_and_send_status(command):
+    """Reply to a /witty_status command with a generated status or help"""
     try:
         # Parse the command
         text = command.get("text", "").strip().lower()
         user_id = command.get("user_id")
         channel_id = command.get("channel_id")
         
-        logger.info(f"Status command received from {user_id}: {text}")
+        logger.info("Status command received from %s: %s", user_id, text,
+                    extra={"event": "command_received", "user_id": user_id, "status_type": text})
         
         # If no status type provided, show help
         if not text:
-            help_text = _get_help_text()
             app.client.chat_postEphemeral(
                 channel=channel_id,
                 user=user_id,
-                text=help_text
+                **catalog.help_response
             )
             return
         
         # Check if status type is valid
-        if text not in STATUS_TYPES:
-            help_text = _get_help_text()
+        if not catalog.is_valid(text):
             app.client.chat_postEphemeral(
                 channel=channel_id,
                 user=user_id,
-                text=f"❌ Unknown status type: `{text}`\n\n{help_text}"
+                **catalog.unknown_type_response(text)
             )
             return
         
@@ -71,27 +79,17 @@ def handle_status_command(ack, command):
             text=status_message
         )
         
-        logger.info(f"Generated status for {user_id}: {status_message}")
+        logger.info("Generated status for %s: %s", user_id, status_message,
+                    extra={"event": "status_generated", "user_id": user_id})
         
     except Exception as e:
-        logger.error(f"Error handling status command: {e}")
+        logger.error("Error handling status command: %s", e, extra={"event": "command_error"})
         app.client.chat_postEphemeral(
             channel=command.get("channel_id"),
             user=command.get("user_id"),
             text="❌ Sorry, something went wrong generating your status message. Please try again."
         )
 
-def _get_help_text():
-    """Generate help text for the command"""
-    help_text = "📝 *Available status types:*\n"
-    for status_type, description in STATUS_TYPES.items():
-        help_text += f"• `{status_type}` - {description}\n"
-    
-    help_text += "\n💡 *Usage:* `/witty_status [type]`\n"
-    help_text += "Example: `/witty_status busy`"
-    
-    return help_text
-
 @app.event("app_mention")
 def handle_app_mention(event, say):
     """Handle when the bot is mentioned"""
@@ -102,7 +100,7 @@ def handle_message(event):
     """Handle regular messages (for debugging)"""
     # Only log if it's not from a bot
     if not event.get("bot_id"):
-        logger.debug(f"Message received: {event.get('text', '')}")
+        logger.debug("Message received: %s", event.get('text', ''))
 
 def main():
     """Main function to run the bot"""
@@ -3,22 +3,21 @@ Slack Status Bot - HTTP Version for Deployment
 """
 
 import os
+import json
 import logging
 from dotenv import load_dotenv
-from flask import Flask, request, jsonify
+from flask import Flask, request
 from slack_bolt import App
 from slack_bolt.adapter.flask import SlackRequestHandler
 from llm_client import LLMClient
-from config import STATUS_TYPES
+from status_catalog import compile_catalog
+from log_config import configure_logging, new_request_id, request_id_var
 
 # Load environment variables
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Initialize Flask app
@@ -33,45 +32,62 @@ app = App(
 # Initialize LLM client
 llm_client = LLMClient()
 
+# Validate config and precompute static responses
+catalog = compile_catalog()
+
 # Initialize Slack request handler
 handler = SlackRequestHandler(app)
 
+# Serialized once, the provider and status types don't change at runtime
+HEALTH_JSON = json.dumps({"status": "healthy", "llm_provider": llm_client.provider})
+HOME_JSON = json.dumps({
+    "message": "Witty Bot is running!",
+    "llm_provider": llm_client.provider,
+    "status_types": list(catalog.type_names)
+})
+
 @app.command("/witty_status")
 def handle_status_command(ack, command):
     """Handle the /witty_status slash command"""
     ack()
-    
+    # Bolt runs handlers on pooled threads, so clear the ID before the thread moves on
+    request_token = new_request_id()
+    try:
+        _generate_and_send_status(command)
+    finally:
+        request_id_var.reset(request_token)
+
+def _generate_and_send_status(command):
+    """Reply to a /witty_status command with a generated status or help"""
     try:
         # Parse the command
         text = command.get("text", "").strip().lower()
         user_id = command.get("user_id")
         channel_id = command.get("channel_id")
         
-        logger.info(f"Status command received from {user_id}: {text}")
+        logger.info("Status command received from %s: %s", user_id, text,
+                    extra={"event": "command_received", "user_id": user_id, "status_type": text})
         
         # If no status type provided, show help
         if not text:
-            help_text = _get_help_text()
             try:
                 app.client.chat_postMessage(
                     channel=user_id,
-                    text=help_text
+                    **catalog.help_response
                 )
             except Exception as e:
-                logger.error(f"Failed to send help text: {e}")
+                logger.error("Failed to send help text: %s", e, extra={"event": "send_failed"})
             return
         
         # Check if status type is valid
-        if text not in STATUS_TYPES:
-            help_text = _get_help_text()
-            error_text = f"❌ Unknown status type: `{text}`\n\n{help_text}"
+        if not catalog.is_valid(text):
             try:
                 app.client.chat_postMessage(
                     channel=user_id,
-                    text=error_text
+                    **catalog.unknown_type_response(text)
                 )
             except Exception as e:
-                logger.error(f"Failed to send error message: {e}")
+                logger.error("Failed to send error message: %s", e, extra={"event": "send_failed"})
             return
         
         # Generate status message
@@ -84,16 +100,19 @@ def handle_status_command(ack, command):
                 channel=user_id,
                 text=status_message
             )
-            logger.info(f"Successfully sent status to user {user_id}")
+            logger.info("Successfully sent status to user %s", user_id,
+                        extra={"event": "status_sent", "user_id": user_id})
         except Exception as e:
-            logger.error(f"Failed to send direct message: {e}")
+            logger.error("Failed to send direct message: %s", e, extra={"event": "send_failed"})
             # Fallback: just log the status
-            logger.info(f"Status for {user_id}: {status_message}")
+            logger.warning("Status for %s: %s", user_id, status_message,
+                           extra={"event": "status_unsent", "user_id": user_id})
         
-        logger.info(f"Generated status for {user_id}: {status_message}")
+        logger.info("Generated status for %s: %s", user_id, status_message,
+                    extra={"event": "status_generated", "user_id": user_id})
         
     except Exception as e:
-        logger.error(f"Error handling status command: {e}")
+        logger.error("Error handling status command: %s", e, extra={"event": "command_error"})
         try:
             app.client.chat_postMessage(
                 channel=command.get("user_id"),
@@ -101,18 +120,7 @@ def handle_status_command(ack, command):
                      "Please try again."
             )
         except Exception as dm_error:
-            logger.error(f"Failed to send error message: {dm_error}")
-
-def _get_help_text():
-    """Generate help text for the command"""
-    help_text = "📝 *Available status types:*\n"
-    for status_type, description in STATUS_TYPES.items():
-        help_text += f"• `{status_type}` - {description}\n"
-    
-    help_text += "\n💡 *Usage:* `/witty_status [type]`\n"
-    help_text += "Example: `/witty_status busy`"
-    
-    return help_text
+            logger.error("Failed to send error message: %s", dm_error, extra={"event": "send_failed"})
 
 @app.event("app_mention")
 def handle_app_mention(event, say):
@@ -128,16 +136,12 @@ def slack_events():
 @flask_app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint"""
-    return jsonify({"status": "healthy", "llm_provider": llm_client.provider})
+    return flask_app.response_class(HEALTH_JSON, mimetype="application/json")
 
 @flask_app.route("/", methods=["GET"])
 def home():
     """Home endpoint"""
-    return jsonify({
-        "message": "Witty Bot is running!",
-        "llm_provider": llm_client.provider,
-        "status_types": list(STATUS_TYPES.keys())
-    })
+    return flask_app.response_class(HOME_JSON, mimetype="application/json")
 
 def main():
     """Main function to run the bot"""
@@ -12,6 +12,20 @@ LOCAL_MODEL_NAME = os.getenv("LOCAL_MODEL_NAME", "distilbert-base-uncased")
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://127.0.0.1:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
 
+# Record provider responses to a JSONL file, or replay them with LLM_PROVIDER=replay
+LLM_RECORD_FILE = os.getenv("LLM_RECORD_FILE")
+LLM_REPLAY_FILE = os.getenv("LLM_REPLAY_FILE")
+LLM_REPLAY_SPEED = float(os.getenv("LLM_REPLAY_SPEED", "1.0"))
+# Only replay responses recorded with these settings (unset = any)
+LLM_REPLAY_PROVIDER = os.getenv("LLM_REPLAY_PROVIDER")
+LLM_REPLAY_MODEL = os.getenv("LLM_REPLAY_MODEL")
+LLM_REPLAY_TEMPERATURE = float(os.environ["LLM_REPLAY_TEMPERATURE"]) if os.getenv("LLM_REPLAY_TEMPERATURE") else None
+LLM_REPLAY_MAX_TOKENS = int(os.environ["LLM_REPLAY_MAX_TOKENS"]) if os.getenv("LLM_REPLAY_MAX_TOKENS") else None
+
+# Optional external templates/blocklist file (.json, .jsonl, .yaml), reloaded on change
+TEMPLATES_FILE = os.getenv("TEMPLATES_FILE")
+TEMPLATES_RELOAD_INTERVAL = float(os.getenv("TEMPLATES_RELOAD_INTERVAL", "5"))
+
 # Status Types and their descriptions
 STATUS_TYPES = {
     "lunch": "Eating lunch",
@@ -0,0 +1,226 @@
+"""
+Offline batch evaluation of LLM providers: output quality vs. latency
+
+Examples:
+    python evaluate.py --providers ollama openai --runs 20
+    python evaluate.py --providers ollama --temperature 0.9 --num-predict 30
+    python evaluate.py --fixtures recorded.jsonl
+"""
+
+import argparse
+import json
+import logging
+import math
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+from config import LLM_PROVIDER, STATUS_TYPES
+from llm_client import LLMClient
+
+logger = logging.getLogger(__name__)
+
+# Providers that actually call a model; 'templates' has nothing to evaluate
+PROVIDERS = ["openai", "local", "ollama", "replay"]
+
+# One client per (provider, settings) in each worker process
+_clients: Dict[tuple, LLMClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(provider: str, temperature: Optional[float], max_tokens: Optional[int]) -> LLMClient:
+    key = (provider, temperature, max_tokens)
+    with _clients_lock:
+        if key not in _clients:
+            _clients[key] = LLMClient(provider, temperature=temperature, max_tokens=max_tokens)
+        return _clients[key]
+
+
+def _generate(provider: str, status_type: str,
+              temperature: Optional[float], max_tokens: Optional[int]) -> dict:
+    """Run a single raw generation and time it"""
+    client = _get_client(provider, temperature, max_tokens)
+    start = time.perf_counter()
+    try:
+        response = client.generate_raw(status_type)
+    except Exception as e:
+        logger.error(f"{provider} generation failed: {e}")
+        response = None
+    return {
+        "source": provider,
+        "model": client.model,
+        "temperature": client.temperature,
+        "max_tokens": client.max_tokens,
+        "status_type": status_type,
+        "response": response,
+        "elapsed": time.perf_counter() - start
+    }
+
+
+def _read_fixtures(path: str) -> Iterator[dict]:
+    """
+    Read recorded generations, one {"status_type", "response", "elapsed"} object
+    per line, with the model and sampling settings when the recording has them
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                row = json.loads(line)
+                yield {
+                    "source": path,
+                    "model": row.get("model"),
+                    "temperature": row.get("temperature"),
+                    "max_tokens": row.get("max_tokens"),
+                    "status_type": row["status_type"],
+                    "response": row.get("response"),
+                    "elapsed": row.get("elapsed", 0.0)
+                }
+
+
+def _score(scorer: LLMClient, row: dict) -> dict:
+    """Apply the production cleaning and filtering to a raw generation"""
+    raw_text = row["response"]
+    if raw_text is None:
+        row.update(cleaned=None, truncated=False, appropriate=False)
+        return row
+
+    cleaned, truncated = scorer.clean_response(raw_text)
+    row.update(
+        cleaned=cleaned,
+        truncated=truncated,
+        appropriate=bool(cleaned) and scorer.is_appropriate(cleaned)
+    )
+    return row
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, math.ceil(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+def _group_label(row: dict) -> str:
+    """Name a source together with the model and sampling settings it ran with"""
+    settings = [
+        f"{key}={row[key]}" for key in ("model", "temperature", "max_tokens")
+        if row.get(key) is not None
+    ]
+    return " ".join([row["source"]] + settings)
+
+
+def summarize(rows: List[dict]) -> Dict[str, dict]:
+    """Aggregate scored rows per source, model and sampling settings"""
+    by_source: Dict[str, List[dict]] = {}
+    for row in rows:
+        by_source.setdefault(_group_label(row), []).append(row)
+
+    summary = {}
+    for source, source_rows in by_source.items():
+        latencies = sorted(row["elapsed"] for row in source_rows)
+        answered = [row for row in source_rows if row["response"] is not None]
+        cleaned = [row["cleaned"] for row in answered if row["cleaned"]]
+        summary[source] = {
+            "runs": len(source_rows),
+            "failed": len(source_rows) - len(answered),
+            "p50": _percentile(latencies, 50),
+            "p90": _percentile(latencies, 90),
+            "p99": _percentile(latencies, 99),
+            "max": latencies[-1],
+            "rejected": _rate(sum(not row["appropriate"] for row in answered), len(answered)),
+            "truncated": _rate(sum(row["truncated"] for row in answered), len(answered)),
+            "distinct": _rate(len(set(cleaned)), len(cleaned))
+        }
+    return summary
+
+
+def _rate(count: int, total: int) -> float:
+    return count / total if total else 0.0
+
+
+def _print_summary(summary: Dict[str, dict]):
+    width = max(len("source"), *map(len, summary)) + 2
+    header = f"{'source':<{width}}{'runs':>6}{'failed':>8}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}" \
+             f"{'rejected':>10}{'truncated':>11}{'distinct':>10}"
+    print(header)
+    print("-" * len(header))
+    for source, stats in summary.items():
+        print(f"{source:<{width}}{stats['runs']:>6}{stats['failed']:>8}"
+              f"{stats['p50']:>7.2f}s{stats['p90']:>7.2f}s{stats['p99']:>7.2f}s{stats['max']:>7.2f}s"
+              f"{stats['rejected']:>10.1%}{stats['truncated']:>11.1%}{stats['distinct']:>10.1%}")
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare LLM providers on quality and latency")
+    parser.add_argument("--providers", nargs="+", default=[], choices=PROVIDERS,
+                        help="providers to run live (default: LLM_PROVIDER unless --fixtures is given)")
+    parser.add_argument("--fixtures", nargs="+", default=[],
+                        help="JSONL files of recorded generations to score instead of calling a provider")
+    parser.add_argument("--status-types", nargs="+", default=list(STATUS_TYPES),
+                        choices=list(STATUS_TYPES), help="status types to generate (default: all)")
+    parser.add_argument("--runs", type=int, default=10, help="generations per status type and provider")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent generations")
+    parser.add_argument("--pool", choices=["thread", "process"], default="thread",
+                        help="use processes for CPU-bound providers such as 'local'")
+    parser.add_argument("--temperature", type=float, help="override the provider's temperature")
+    parser.add_argument("--num-predict", type=int, help="override the provider's token limit")
+    parser.add_argument("--output", default="evaluation.jsonl", help="where to stream per-generation results")
+    args = parser.parse_args(argv)
+    if not args.providers and not args.fixtures:
+        if LLM_PROVIDER not in PROVIDERS:
+            parser.error(f"LLM_PROVIDER={LLM_PROVIDER} has nothing to evaluate, pass --providers or --fixtures")
+        args.providers = [LLM_PROVIDER]
+    return args
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the evaluation and print a summary table"""
+    load_dotenv()
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    args = _parse_args(argv)
+
+    # Templates provider only serves as the production cleaner and filter
+    scorer = LLMClient("templates")
+    rows: List[dict] = []
+
+    with open(args.output, "w", encoding="utf-8") as output:
+        def record(row: dict):
+            rows.append(_score(scorer, row))
+            output.write(json.dumps(row) + "\n")
+            output.flush()
+
+        for path in args.fixtures:
+            for row in _read_fixtures(path):
+                if row["status_type"] in args.status_types:
+                    record(row)
+
+        if args.providers:
+            pool_class = ProcessPoolExecutor if args.pool == "process" else ThreadPoolExecutor
+            with pool_class(max_workers=args.workers) as pool:
+                futures = [
+                    pool.submit(_generate, provider, status_type, args.temperature, args.num_predict)
+                    for provider in args.providers
+                    for status_type in args.status_types
+                    for _ in range(args.runs)
+                ]
+                for done, future in enumerate(as_completed(futures), 1):
+                    record(future.result())
+                    print(f"\r{done}/{len(futures)} generations", end="", file=sys.stderr)
+                print(file=sys.stderr)
+
+    if not rows:
+        print("Nothing to evaluate")
+        return
+
+    _print_summary(summarize(rows))
+    print(f"\nPer-generation results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,18 @@ LLM Client for generating status messages using multiple providers
 import requests
 import random
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Optional, Tuple
 from config import (
     LLM_PROVIDER, LOCAL_MODEL_NAME, 
-    OLLAMA_BASE_URL, OLLAMA_MODEL, STATUS_TEMPLATES, 
-    PROMPT_TEMPLATE, UNPROFESSIONAL_WORDS
+    OLLAMA_BASE_URL, OLLAMA_MODEL, PROMPT_TEMPLATE,
+    TEMPLATES_FILE, TEMPLATES_RELOAD_INTERVAL,
+    LLM_RECORD_FILE, LLM_REPLAY_FILE, LLM_REPLAY_SPEED,
+    LLM_REPLAY_PROVIDER, LLM_REPLAY_MODEL, LLM_REPLAY_TEMPERATURE, LLM_REPLAY_MAX_TOKENS
 )
+from recording import Recorder, Replayer
+from template_store import TemplateSnapshot, TemplateStore
 
 # Try to import optional dependencies
 try:
@@ -20,10 +26,43 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Longest status message we hand back to Slack
+MAX_STATUS_LENGTH = 50
+
+# Model and sampling defaults per provider; max_tokens is num_predict for Ollama
+# and the number of new tokens for the local model
+PROVIDER_DEFAULTS = {
+    "openai": {"model": "gpt-3.5-turbo", "temperature": 0.8, "max_tokens": 50},
+    "local": {"model": LOCAL_MODEL_NAME, "temperature": 0.8, "max_tokens": 10},
+    "ollama": {"model": OLLAMA_MODEL, "temperature": 0.7, "max_tokens": 20},
+}
+
+_template_store: Optional[TemplateStore] = None
+_template_store_lock = threading.Lock()
+
+def get_template_store() -> TemplateStore:
+    """Return the process-wide template store, starting its watcher on first use"""
+    global _template_store
+    with _template_store_lock:
+        if _template_store is None:
+            _template_store = TemplateStore(TEMPLATES_FILE, TEMPLATES_RELOAD_INTERVAL)
+            _template_store.start_watching()
+        return _template_store
+
 class LLMClient:
-    def __init__(self):
-        self.provider = LLM_PROVIDER
+    def __init__(self, provider: Optional[str] = None,
+                 temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                 template_store: Optional[TemplateStore] = None):
+        self.provider = provider or LLM_PROVIDER
+        # Effective settings: explicit overrides (used by evaluate.py) win over provider defaults
+        defaults = PROVIDER_DEFAULTS.get(self.provider, {})
+        self.model = defaults.get("model")
+        self.temperature = temperature if temperature is not None else defaults.get("temperature")
+        self.max_tokens = max_tokens if max_tokens is not None else defaults.get("max_tokens")
         self.session = requests.Session()
+        # Shared by every client in the process so the file is polled once
+        self.template_store = template_store or get_template_store()
+        self.recorder = Recorder(LLM_RECORD_FILE) if LLM_RECORD_FILE else None
         
         # Initialize provider-specific clients
         if self.provider == "openai":
@@ -32,6 +71,8 @@ class LLMClient:
             self._init_local()
         elif self.provider == "ollama":
             self._init_ollama()
+        elif self.provider == "replay":
+            self._init_replay()
         else:
             logger.warning(f"Unknown LLM provider: {self.provider}, using templates only")
     
@@ -65,39 +106,101 @@ class LLMClient:
     def _init_ollama(self):
         """Initialize Ollama client"""
         self.ollama_url = OLLAMA_BASE_URL
-        self.ollama_model = OLLAMA_MODEL
+        self.ollama_model = self.model
         logger.info(f"✅ Ollama client initialized for {self.ollama_model}")
     
+    def _init_replay(self):
+        """Initialize replay of recorded responses"""
+        if not LLM_REPLAY_FILE:
+            logger.warning("LLM_REPLAY_FILE not set, will use templates only")
+            self.replayer = None
+            return
+        try:
+            self.replayer = Replayer(LLM_REPLAY_FILE, LLM_REPLAY_SPEED,
+                                     provider=LLM_REPLAY_PROVIDER, model=LLM_REPLAY_MODEL,
+                                     temperature=LLM_REPLAY_TEMPERATURE, max_tokens=LLM_REPLAY_MAX_TOKENS)
+        except Exception as e:
+            logger.warning(f"Failed to load recorded responses: {e}, will use templates only")
+            self.replayer = None
+    
     def generate_status(self, status_type: str) -> str:
         """
         Generate a funny status message for the given status type.
         Falls back to template messages if LLM is unavailable or slow.
         """
+        # Filter and fallback see the same templates even if a reload lands mid-request
+        snapshot = self.template_store.snapshot
+        
         # For templates provider, use templates directly
         if self.provider == "templates":
-            return self._get_template_status(status_type)
+            return self._get_template_status(status_type, snapshot)
         
         try:
             # Try to generate with LLM first
             llm_response = self._generate_with_llm(status_type)
             
-            if llm_response and self._is_appropriate(llm_response):
+            if llm_response and self.is_appropriate(llm_response, snapshot):
                 return llm_response
                 
         except Exception as e:
-            logger.warning(f"LLM generation failed: {e}")
+            logger.warning("LLM generation failed: %s", e, extra={"event": "llm_failed"})
         
         # Fallback to template messages
-        return self._get_template_status(status_type)
+        return self._get_template_status(status_type, snapshot)
     
     def _generate_with_llm(self, status_type: str) -> Optional[str]:
-        """Generate status message using the configured LLM provider"""
+        """Generate and clean a status message using the configured LLM provider"""
+        raw_text = self.generate_raw(status_type)
+        if raw_text is None:
+            return None
+        cleaned, _ = self.clean_response(raw_text)
+        return cleaned
+    
+    def generate_raw(self, status_type: str) -> Optional[str]:
+        """Get the uncleaned model output, recording it if LLM_RECORD_FILE is set"""
+        if self.recorder is None:
+            return self._call_provider(status_type)
+        
+        start = time.perf_counter()
+        raw_text = self._call_provider(status_type)
+        self.recorder.record(
+            provider=self.provider,
+            model=self.model,
+            status_type=status_type,
+            prompt=self._build_prompt(status_type),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            response=raw_text,
+            elapsed=time.perf_counter() - start
+        )
+        return raw_text
+    
+    def _build_prompt(self, status_type: str) -> Optional[str]:
+        """Build the prompt sent to the configured LLM provider"""
+        if self.provider == "openai":
+            return PROMPT_TEMPLATE.format(
+                status_type=status_type,
+                context=f"User wants a {status_type} status message",
+                avoid_words=", ".join(self.template_store.snapshot.blocklist[:5])
+            )
+        elif self.provider == "local":
+            return f"Generate a funny {status_type} status message: "
+        elif self.provider == "ollama":
+            # Simplified prompt for faster generation
+            return f"Generate a funny {status_type} status message (max 50 chars): "
+        else:
+            return None
+    
+    def _call_provider(self, status_type: str) -> Optional[str]:
+        """Dispatch to the configured LLM provider"""
         if self.provider == "openai":
             return self._generate_with_openai(status_type)
         elif self.provider == "local":
             return self._generate_with_local(status_type)
         elif self.provider == "ollama":
             return self._generate_with_ollama(status_type)
+        elif self.provider == "replay":
+            return self._generate_with_replay(status_type)
         elif self.provider == "templates":
             return None  # Will fall back to templates
         else:
@@ -109,27 +212,22 @@ class LLMClient:
             return None
             
         try:
-            prompt = PROMPT_TEMPLATE.format(
-                status_type=status_type,
-                context=f"User wants a {status_type} status message",
-                avoid_words=", ".join(UNPROFESSIONAL_WORDS[:5])
-            )
+            prompt = self._build_prompt(status_type)
             
             response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a professional but funny status message generator."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=50,
-                temperature=0.8
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
             )
             
-            generated_text = response.choices[0].message.content.strip()
-            return self._clean_response(generated_text)
+            return response.choices[0].message.content.strip()
             
         except Exception as e:
-            logger.error(f"Error generating with OpenAI: {e}")
+            logger.error("Error generating with OpenAI: %s", e, extra={"event": "openai_error"})
             return None
     
     def _generate_with_local(self, status_type: str) -> Optional[str]:
@@ -138,32 +236,31 @@ class LLMClient:
             return None
             
         try:
-            prompt = f"Generate a funny {status_type} status message: "
+            prompt = self._build_prompt(status_type)
             
             response = self.local_model(
                 prompt,
-                max_length=len(prompt.split()) + 10,
-                temperature=0.8,
+                max_length=len(prompt.split()) + self.max_tokens,
+                temperature=self.temperature,
                 do_sample=True,
                 pad_token_id=self.local_model.tokenizer.eos_token_id
             )
             
             generated_text = response[0]['generated_text']
             # Extract only the new part
-            new_text = generated_text[len(prompt):].strip()
-            return self._clean_response(new_text)
+            return generated_text[len(prompt):].strip()
             
         except Exception as e:
-            logger.error(f"Error generating with local model: {e}")
+            logger.error("Error generating with local model: %s", e, extra={"event": "local_error"})
             return None
     
     def _generate_with_ollama(self, status_type: str) -> Optional[str]:
         """Generate status message using Ollama LLM"""
         try:
-            # Simplified prompt for faster generation
-            prompt = f"Generate a funny {status_type} status message (max 50 chars): "
+            prompt = self._build_prompt(status_type)
             
-            logger.info(f"Attempting to generate with Ollama model: {self.ollama_model}")
+            logger.info("Attempting to generate with Ollama model: %s", self.ollama_model,
+                        extra={"event": "ollama_request", "model": self.ollama_model})
             
             response = self.session.post(
                 f"{self.ollama_url}/api/generate",
@@ -172,60 +269,69 @@ class LLMClient:
                     "prompt": prompt,
                     "stream": False,
                     "options": {
-                        "temperature": 0.7,
+                        "temperature": self.temperature,
                         "top_p": 0.8,
-                        "num_predict": 20,
+                        "num_predict": self.max_tokens,
                         "repeat_penalty": 1.1
                     }
                 },
                 timeout=8
             )
             
-            logger.info(f"Ollama response status: {response.status_code}")
+            logger.info("Ollama response status: %s", response.status_code,
+                        extra={"event": "ollama_response", "status_code": response.status_code})
             
             if response.status_code == 200:
                 result = response.json()
                 generated_text = result.get("response", "").strip()
-                logger.info(f"Ollama generated: {generated_text}")
-                return self._clean_response(generated_text)
+                logger.info("Ollama generated: %s", generated_text, extra={"event": "ollama_generated"})
+                return generated_text
             else:
-                logger.error(f"Ollama API error: {response.status_code} - {response.text}")
+                logger.error("Ollama API error: %s - %s", response.status_code, response.text,
+                             extra={"event": "ollama_error", "status_code": response.status_code})
                 return None
             
         except Exception as e:
-            logger.error(f"Error generating with Ollama: {e}")
+            logger.error("Error generating with Ollama: %s", e, extra={"event": "ollama_error"})
             return None
     
-    def _clean_response(self, text: str) -> str:
-        """Clean and format the generated response"""
+    def _generate_with_replay(self, status_type: str) -> Optional[str]:
+        """Serve a recorded response with its recorded (scaled) latency"""
+        if not hasattr(self, 'replayer') or self.replayer is None:
+            return None
+        return self.replayer.replay(status_type)
+    
+    def clean_response(self, text: str) -> Tuple[str, bool]:
+        """Clean and format the generated response, reporting whether it was truncated"""
         if not text:
-            return ""
+            return "", False
         
         # Remove quotes if present
         text = text.strip('"\'')
         # Take only the first line
         text = text.split('\n')[0]
         # Limit length
-        if len(text) > 50:
-            text = text[:47] + "..."
+        truncated = len(text) > MAX_STATUS_LENGTH
+        if truncated:
+            text = text[:MAX_STATUS_LENGTH - 3] + "..."
         
-        return text.strip()
+        return text.strip(), truncated
     
-    def _get_template_status(self, status_type: str) -> str:
+    def _get_template_status(self, status_type: str, snapshot: Optional[TemplateSnapshot] = None) -> str:
         """Get a random template status message"""
-        templates = STATUS_TEMPLATES.get(status_type)
+        snapshot = snapshot or self.template_store.snapshot
+        templates = snapshot.templates.get(status_type)
         if not templates:
             return "No template found for this status type"
         return random.choice(templates)
     
-    def _is_appropriate(self, text: str) -> bool:
+    def is_appropriate(self, text: str, snapshot: Optional[TemplateSnapshot] = None) -> bool:
         """Check if the generated text is appropriate"""
-        text_lower = text.lower()
+        snapshot = snapshot or self.template_store.snapshot
         
         # Check for unprofessional words
-        for word in UNPROFESSIONAL_WORDS:
-            if word.lower() in text_lower:
-                return False
+        if snapshot.is_blocked(text):
+            return False
         
         # Check for empty or very short responses
         if len(text.strip()) < 3:
@@ -241,6 +347,8 @@ class LLMClient:
             return self._test_local_connection()
         elif self.provider == "ollama":
             return self._test_ollama_connection()
+        elif self.provider == "replay":
+            return getattr(self, 'replayer', None) is not None and self.replayer.count > 0
         else:
             return False
     
@@ -251,7 +359,7 @@ class LLMClient:
         try:
             # Simple test call
             response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=self.model,
                 messages=[{"role": "user", "content": "Hello"}],
                 max_tokens=5
             )
@@ -0,0 +1,119 @@
+"""
+Structured, sampled, non-blocking logging for the request path
+"""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import uuid
+import zlib
+from typing import Optional
+
+# Correlation ID of the slash command currently being handled
+request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def new_request_id() -> contextvars.Token:
+    """
+    Start a new correlation ID for the current request. Pass the returned token
+    to request_id_var.reset() when the request is done, since handlers run on
+    pooled threads that go on to serve unrelated work.
+    """
+    return request_id_var.set(uuid.uuid4().hex[:12])
+
+
+class RequestSampler(logging.Filter):
+    """
+    Attach the correlation ID and keep only a sample of success-path records.
+    Warnings and errors are always kept. The decision is made per request ID,
+    so a sampled request keeps all of its records.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.threshold = int(max(0.0, min(1.0, rate)) * 0xFFFFFFFF)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        request_id = request_id_var.get()
+        record.request_id = request_id
+        if record.levelno >= logging.WARNING or request_id is None:
+            return True
+        return zlib.crc32(request_id.encode()) <= self.threshold
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records with only the message merged; the listener thread does
+    the JSON/text layout and exception formatting and writes. The merge has to
+    happen here because arguments from any library may be mutated after the
+    call, and records dropped by sampling never reach it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unlike QueueHandler.prepare, keep exc_info for JsonFormatter
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """Render a record as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        if getattr(record, "request_id", None):
+            event["request_id"] = record.request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key != "request_id":
+                event[key] = value
+        if record.exc_info:
+            event["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+def configure_logging():
+    """
+    Route all logging through a queue to a background writer thread.
+
+    LOG_LEVEL sets the root level, LOG_FORMAT is `json` or `text` and
+    LOG_SAMPLE_RATE is the share of requests whose info/debug records are kept.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    if os.getenv("LOG_FORMAT", "json") == "text":
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(message)s')
+    else:
+        formatter = JsonFormatter()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestSampler(float(os.getenv("LOG_SAMPLE_RATE", "1.0"))))
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    # Flush whatever is still queued on shutdown
+    atexit.register(_listener.stop)
@@ -0,0 +1,109 @@
+"""
+Recording and replay of LLM provider responses for deterministic tests and benchmarks
+"""
+
+import itertools
+import json
+import logging
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Recorded fields that tell runs with different settings apart
+_SETTINGS_KEYS = ("provider", "model", "temperature", "max_tokens")
+
+
+class Recorder:
+    """Append provider requests and responses with their timings to a JSONL file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+        logger.info(f"✅ Recording LLM responses to {path}")
+
+    def record(self, provider: str, model: Optional[str], status_type: str, prompt: Optional[str],
+               temperature: Optional[float], max_tokens: Optional[int],
+               response: Optional[str], elapsed: float):
+        """Write one request/response pair with the effective model and sampling settings"""
+        line = json.dumps({
+            "provider": provider,
+            "model": model,
+            "status_type": status_type,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response": response,
+            "elapsed": round(elapsed, 4)
+        }, separators=(",", ":"))
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class Replayer:
+    """
+    Serve recorded responses back per status type, cycling through them in
+    recorded order. Latency is the recorded one multiplied by speed, so 0
+    replays instantly. Any of provider, model, temperature and max_tokens
+    that is given restricts replay to responses recorded with that setting.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0,
+                 provider: Optional[str] = None, model: Optional[str] = None,
+                 temperature: Optional[float] = None, max_tokens: Optional[int] = None):
+        self.path = path
+        self.speed = speed
+        self._lock = threading.Lock()
+        wanted = dict(zip(_SETTINGS_KEYS, (provider, model, temperature, max_tokens)))
+        filters = {key: value for key, value in wanted.items() if value is not None}
+
+        recordings: Dict[str, list] = {}
+        settings = set()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                row = json.loads(line)
+                if any(row.get(key) != value for key, value in filters.items()):
+                    continue
+                settings.add(tuple(row.get(key) for key in _SETTINGS_KEYS))
+                recordings.setdefault(row["status_type"], []).append(
+                    (row.get("response"), float(row.get("elapsed", 0.0)))
+                )
+
+        if len(settings) > 1:
+            described = "; ".join(
+                ", ".join(f"{key}={value}" for key, value in zip(_SETTINGS_KEYS, values))
+                for values in sorted(settings, key=str)
+            )
+            logger.warning(f"{path} mixes recordings made with different settings, "
+                           f"set LLM_REPLAY_PROVIDER/MODEL/TEMPERATURE/MAX_TOKENS to pick one: {described}")
+
+        self.count = sum(map(len, recordings.values()))
+        self._cycles: Dict[str, Iterator] = {
+            status_type: itertools.cycle(rows) for status_type, rows in recordings.items()
+        }
+        logger.info(f"✅ Loaded {self.count} recorded responses from {path}")
+
+    def replay(self, status_type: str) -> Optional[str]:
+        """Return the next recorded response for the status type after its recorded delay"""
+        cycle = self._cycles.get(status_type)
+        if cycle is None:
+            logger.warning(f"No recorded responses for status type: {status_type}")
+            return None
+
+        with self._lock:
+            response, elapsed = next(cycle)
+
+        if self.speed > 0:
+            time.sleep(elapsed * self.speed)
+        return response
@@ -0,0 +1,83 @@
+"""
+Precompiled status catalog: help text, static responses and typo suggestions
+"""
+
+import difflib
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from config import STATUS_TYPES, STATUS_TEMPLATES
+
+COMMAND = "/witty_status"
+
+# Slack rejects section blocks over 3000 characters, so cap what we echo back
+MAX_ECHO_LENGTH = 100
+
+
+class StatusCatalog:
+    """Static responses built once at startup from the status configuration"""
+
+    def __init__(self, status_types: Dict[str, str], status_templates: Dict[str, List[str]]):
+        _validate(status_types, status_templates)
+
+        self.status_types = status_types
+        self.type_names = tuple(status_types)
+        self.help_text = _build_help_text(status_types)
+        self.help_response = _build_response(self.help_text)
+
+        # Wrap the bound method so repeated typos are answered from cache
+        self.unknown_type_response = lru_cache(maxsize=256)(self._unknown_type_response)
+
+    def is_valid(self, status_type: str) -> bool:
+        """Check if the status type is known"""
+        return status_type in self.status_types
+
+    def suggest(self, text: str) -> Optional[str]:
+        """Return the closest status type for a mistyped command, if any"""
+        matches = difflib.get_close_matches(text, self.type_names, n=1, cutoff=0.6)
+        return matches[0] if matches else None
+
+    def _unknown_type_response(self, text: str) -> Dict[str, object]:
+        """Build the message payload for an unknown status type"""
+        if len(text) > MAX_ECHO_LENGTH:
+            text = text[:MAX_ECHO_LENGTH - 3] + "..."
+        suggestion = self.suggest(text)
+        hint = f"Did you mean `{COMMAND} {suggestion}`?\n" if suggestion else ""
+        return _build_response(f"❌ Unknown status type: `{text}`\n{hint}\n{self.help_text}")
+
+
+def _validate(status_types: Dict[str, str], status_templates: Dict[str, List[str]]):
+    """Fail fast on configuration mistakes instead of at request time"""
+    if not status_types:
+        raise ValueError("STATUS_TYPES must define at least one status type")
+
+    missing = [name for name in status_types if not status_templates.get(name)]
+    if missing:
+        raise ValueError(f"STATUS_TEMPLATES has no templates for: {', '.join(missing)}")
+
+    for name in status_types:
+        if name != name.strip().lower() or " " in name:
+            raise ValueError(f"Status type '{name}' must be a single lowercase word")
+
+
+def _build_help_text(status_types: Dict[str, str]) -> str:
+    """Generate help text for the command"""
+    lines = ["📝 *Available status types:*"]
+    lines.extend(f"• `{name}` - {description}" for name, description in status_types.items())
+    lines.append("")
+    lines.append(f"💡 *Usage:* `{COMMAND} [type]`")
+    lines.append(f"Example: `{COMMAND} {next(iter(status_types))}`")
+    return "\n".join(lines)
+
+
+def _build_response(text: str) -> Dict[str, object]:
+    """Build chat.post* keyword arguments with a single mrkdwn section block"""
+    return {
+        "text": text,
+        "blocks": [{"type": "section", "text": {"type": "mrkdwn", "text": text}}]
+    }
+
+
+def compile_catalog() -> StatusCatalog:
+    """Validate config.py and precompute all static responses"""
+    return StatusCatalog(STATUS_TYPES, STATUS_TEMPLATES)
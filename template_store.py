@@ -0,0 +1,181 @@
+"""
+Hot-reloadable store for status templates and the unprofessional word blocklist
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from config import STATUS_TYPES, STATUS_TEMPLATES, UNPROFESSIONAL_WORDS
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateSnapshot:
+    """Immutable, precompiled view of the templates and blocklist"""
+
+    def __init__(self, templates: Dict[str, List[str]], blocklist: List[str]):
+        self.templates: Dict[str, Tuple[str, ...]] = {
+            status_type: tuple(items) for status_type, items in templates.items()
+        }
+        self.blocklist: Tuple[str, ...] = tuple(word.lower() for word in blocklist if word)
+
+        # One alternation instead of a substring scan per word; longest first
+        # so overlapping phrases don't shadow each other
+        if self.blocklist:
+            words = sorted(set(self.blocklist), key=len, reverse=True)
+            self._blocked = re.compile("|".join(re.escape(word) for word in words))
+        else:
+            self._blocked = None
+
+    def is_blocked(self, text: str) -> bool:
+        """Check if the text contains any blocklisted word"""
+        return self._blocked is not None and self._blocked.search(text.lower()) is not None
+
+
+class TemplateStore:
+    """
+    Serves the current TemplateSnapshot, optionally loaded from a JSON, JSONL
+    or YAML file that is polled for changes and swapped in atomically.
+    """
+
+    def __init__(self, path: Optional[str] = None, reload_interval: float = 5.0):
+        self.path = path
+        if reload_interval <= 0:
+            # A zero wait would turn the watcher into a busy loop
+            logger.warning(f"Invalid templates reload interval {reload_interval}, using 5 seconds")
+            reload_interval = 5.0
+        self.reload_interval = reload_interval
+        self._mtime: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.snapshot = TemplateSnapshot(STATUS_TEMPLATES, UNPROFESSIONAL_WORDS)
+
+        if self.path:
+            self.reload_if_changed()
+
+    def reload_if_changed(self) -> bool:
+        """Reload the file if it changed since the last load"""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError as e:
+            # Only report once until the file shows up again
+            if self._mtime != -1.0:
+                logger.error(f"Cannot read templates file {self.path}: {e}")
+                self._mtime = -1.0
+            return False
+
+        if mtime == self._mtime:
+            return False
+
+        try:
+            snapshot = _load_snapshot(self.path)
+        except Exception as e:
+            # Keep serving the previous snapshot until the file is fixed
+            logger.error(f"Failed to load templates from {self.path}: {e}")
+            self._mtime = mtime
+            return False
+
+        # Snapshots are never mutated, so a single attribute assignment is all
+        # the swap needs; generate_status holds one reference for its filter
+        # and fallback so a request never mixes two versions
+        self.snapshot = snapshot
+        self._mtime = mtime
+        logger.info(f"✅ Loaded {sum(map(len, snapshot.templates.values()))} templates "
+                    f"and {len(snapshot.blocklist)} blocked words from {self.path}")
+        return True
+
+    def start_watching(self):
+        """Poll the templates file in a background thread"""
+        if not self.path or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._watch, name="template-store", daemon=True)
+        self._thread.start()
+
+    def stop_watching(self):
+        """Stop the background polling thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self):
+        while not self._stop.wait(self.reload_interval):
+            self.reload_if_changed()
+
+
+def _load_snapshot(path: str) -> TemplateSnapshot:
+    """Parse a templates file and build a validated snapshot"""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    if path.endswith(".jsonl"):
+        data = _parse_jsonl(content)
+    elif path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("PyYAML is not installed, use a .json or .jsonl file instead")
+        data = yaml.safe_load(content) or {}
+    else:
+        data = json.loads(content)
+
+    if not isinstance(data, dict):
+        raise ValueError("templates file must contain a mapping")
+
+    # Sections left out of the file keep the config.py defaults
+    templates = data.get("templates")
+    if templates is None:
+        templates = STATUS_TEMPLATES
+    blocklist = data.get("unprofessional_words")
+    if blocklist is None:
+        blocklist = UNPROFESSIONAL_WORDS
+
+    if not isinstance(templates, dict):
+        raise ValueError("'templates' must map status types to lists of strings")
+    for status_type, items in templates.items():
+        if not isinstance(items, list) or not items or not _all_strings(items):
+            raise ValueError(f"templates for '{status_type}' must be a non-empty list of strings")
+    if not isinstance(blocklist, list) or not _all_strings(blocklist):
+        raise ValueError("'unprofessional_words' must be a list of strings")
+
+    missing = [name for name in STATUS_TYPES if not templates.get(name)]
+    if missing:
+        raise ValueError(f"no templates for: {', '.join(missing)}")
+
+    return TemplateSnapshot(templates, blocklist)
+
+
+def _all_strings(items: list) -> bool:
+    return all(isinstance(item, str) for item in items)
+
+
+def _parse_jsonl(content: str) -> dict:
+    """
+    Parse one JSON object per line, either
+    {"status_type": "lunch", "template": "..."} or {"unprofessional_word": "..."}
+    """
+    templates: Dict[str, List[str]] = {}
+    blocklist: List[str] = []
+
+    for line_number, line in enumerate(content.splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        entry = json.loads(line)
+        if "template" in entry:
+            templates.setdefault(entry["status_type"], []).append(entry["template"])
+        elif "unprofessional_word" in entry:
+            blocklist.append(entry["unprofessional_word"])
+        else:
+            raise ValueError(f"line {line_number}: expected 'template' or 'unprofessional_word'")
+
+    data = {}
+    if templates:
+        data["templates"] = templates
+    if blocklist:
+        data["unprofessional_words"] = blocklist
+    return data